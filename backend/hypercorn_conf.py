@@ -0,0 +1,15 @@
+"""Hypercorn settings for running the backend in production.
+
+Launch with: hypercorn -c python:hypercorn_conf main:app
+(`python main.py` remains the debug-only dev server.)
+"""
+import os
+
+bind = [f"0.0.0.0:{os.environ.get('PORT', '5000')}"]
+
+# One process per core sidesteps the GIL for the thread-pool GCP calls
+workers = int(os.environ.get('WEB_CONCURRENCY', os.cpu_count() or 1))
+
+# SSE streams idle between pipeline events; keep connections open long
+# enough that proxies and browsers don't recycle them between frames
+keep_alive_timeout = 75
@@ -83,6 +83,15 @@ const INFRA_STEPS = [
   { id: 'configure-cloud-nat', label: 'Configure Cloud NAT', command: 'Router + NAT for outbound', icon: 'router' },
 ];
 
+// Setup steps grouped into stages whose members have no dependencies on
+// each other; each stage runs concurrently, stages run in order.
+// (network + NAT depend on APIs; IAM roles depend on the service account)
+const INFRA_STAGES = [
+  ['enable-apis'],
+  ['create-sa', 'org-policies', 'create-network'],
+  ['iam-roles', 'configure-cloud-nat'],
+];
+
 const GCP_DIFFERENTIATORS_INDEX = `🧬 Salmon Index Creation:
 • Creates reference transcriptome index for quantification
 • Runs on Google Batch with automatic VM provisioning
@@ -468,6 +477,14 @@ const WorkloadFlowInner: React.FC<WorkloadFlowInnerProps> = ({ onComplete }) =>
     }));
   };
 
+  const addLogs = (stepId: string, entries: { message: string; type: 'info' | 'success' | 'error' }[]) => {
+    const timestamp = new Date().toLocaleTimeString('en-US', { hour12: false });
+    setStepStatuses(prev => ({
+      ...prev,
+      [stepId]: { ...prev[stepId], logs: [...(prev[stepId]?.logs || []), ...entries.map(e => ({ timestamp, ...e }))] },
+    }));
+  };
+
   const runStep = async (stepId: string, stepLabel: string, signal: AbortSignal) => {
     setStepStatuses(prev => ({ ...prev, [stepId]: { status: 'running', logs: prev[stepId]?.logs || [] } }));
     setSelectedStep(stepId);
@@ -520,6 +537,11 @@ const WorkloadFlowInner: React.FC<WorkloadFlowInnerProps> = ({ onComplete }) =>
               }
               
               if (data.log) addLog(stepId, data.log, data.type || 'info');
+
+              // Coalesced log frames from the pipeline stream
+              if (Array.isArray(data.batch) && data.batch.length > 0) {
+                addLogs(stepId, data.batch.map((e: any) => ({ message: e.log, type: e.type || 'info' })));
+              }
               
               if (data.status === 'complete') {
                 setStepStatuses(prev => ({ ...prev, [stepId]: { ...prev[stepId], status: 'complete' } }));
@@ -670,20 +692,48 @@ const WorkloadFlowInner: React.FC<WorkloadFlowInnerProps> = ({ onComplete }) =>
 
     zoomToSetup();
 
-    // Run infrastructure setup steps
+    // Fast path: one concurrent existence sweep on the backend; if all the
+    // setup resources are already in place, skip re-running every step
     setCurrentPhase('setup');
-    for (const step of INFRA_STEPS) {
-      if (abortController.signal.aborted) break;
-      const success = await runStep(step.id, step.label, abortController.signal);
-      if (!success) break;
-    }
+    let alreadyProvisioned = false;
+    try {
+      const pf = await fetch('/api/preflight', { signal: abortController.signal });
+      if (pf.ok) {
+        const data = await pf.json();
+        if (data.allReady) {
+          const timestamp = new Date().toLocaleTimeString('en-US', { hour12: false });
+          [...INFRA_STEPS.map(s => s.id), 'provision-workbench'].forEach(id => {
+            setStepStatuses(prev => ({
+              ...prev,
+              [id]: {
+                status: 'complete',
+                logs: [...(prev[id]?.logs || []), { timestamp, message: 'Already provisioned (preflight check)', type: 'success' }],
+              },
+            }));
+          });
+          if (data.workbench?.workbenchUrl) setWorkbenchUrl(data.workbench.workbenchUrl);
+          alreadyProvisioned = true;
+        }
+      }
+    } catch {}
+
+    if (!alreadyProvisioned) {
+      // Run infrastructure setup steps; independent steps within a stage
+      // stream concurrently, which overlaps their long-running operations
+      for (const stage of INFRA_STAGES) {
+        if (abortController.signal.aborted) break;
+        const steps = INFRA_STEPS.filter(s => stage.includes(s.id));
+        const results = await Promise.all(steps.map(s => runStep(s.id, s.label, abortController.signal)));
+        if (results.some(success => !success)) break;
+      }
 
-    // Provision workbench
-    if (!abortController.signal.aborted) {
-      const success = await runStep('provision-workbench', 'Provision Workbench', abortController.signal);
-      if (!success) { 
-        setIsRunning(false); 
-        return; 
+      // Provision workbench
+      if (!abortController.signal.aborted) {
+        const success = await runStep('provision-workbench', 'Provision Workbench', abortController.signal);
+        if (!success) {
+          setIsRunning(false);
+          return;
+        }
       }
     }
 